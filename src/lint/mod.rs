@@ -1,4 +1,4 @@
-use crate::model::FamilyTree;
+use crate::model::{Event, FamilyTree};
 use std::fmt;
 
 /// Category of a lint warning.
@@ -10,15 +10,22 @@ pub enum LintCategory {
     DateInconsistency,
 }
 
-impl fmt::Display for LintCategory {
-    fn fmt(&self, f: &mut fmt::Formatter<'_>) -> fmt::Result {
+impl LintCategory {
+    /// Short label used in output, e.g. "dangling-ref".
+    pub fn as_str(&self) -> &'static str {
         match self {
-            LintCategory::DanglingReference => write!(f, "dangling-ref"),
-            LintCategory::DateInconsistency => write!(f, "date"),
+            LintCategory::DanglingReference => "dangling-ref",
+            LintCategory::DateInconsistency => "date",
         }
     }
 }
 
+impl fmt::Display for LintCategory {
+    fn fmt(&self, f: &mut fmt::Formatter<'_>) -> fmt::Result {
+        f.write_str(self.as_str())
+    }
+}
+
 /// A data quality issue found after parsing.
 #[derive(Debug, Clone)]
 pub struct LintWarning {
@@ -40,9 +47,9 @@ pub fn lint(tree: &FamilyTree) -> Vec<LintWarning> {
     check_date_inconsistencies(tree, &mut warnings);
     warnings.sort_by(|a, b| {
         a.category
-            .to_string()
-            .cmp(&b.category.to_string())
-            .then(a.message.cmp(&b.message))
+            .as_str()
+            .cmp(b.category.as_str())
+            .then_with(|| a.message.cmp(&b.message))
     });
     warnings
 }
@@ -172,8 +179,8 @@ fn check_date_inconsistencies(tree: &FamilyTree, out: &mut Vec<LintWarning>) {
         let indi = &tree.individuals[*xref];
         let name = indi.display_name();
 
-        let birth_year = indi.birth.as_ref().and_then(|e| e.date.as_ref()).and_then(|d| d.year);
-        let death_year = indi.death.as_ref().and_then(|e| e.date.as_ref()).and_then(|d| d.year);
+        let birth_year = indi.birth_year();
+        let death_year = indi.death_year();
 
         // Death before birth
         if let (Some(b), Some(d)) = (birth_year, death_year) {
@@ -193,22 +200,13 @@ fn check_date_inconsistencies(tree: &FamilyTree, out: &mut Vec<LintWarning>) {
     for fam_xref in &fam_xrefs {
         let fam = &tree.families[*fam_xref];
 
-        let marriage_year = fam
-            .marriage
-            .as_ref()
-            .and_then(|e| e.date.as_ref())
-            .and_then(|d| d.year);
+        let marriage_year = fam.marriage.as_ref().and_then(Event::year);
 
         if let Some(marr_year) = marriage_year {
             for (role, indi_xref_opt) in [("husband", &fam.husband), ("wife", &fam.wife)] {
                 if let Some(indi_xref) = indi_xref_opt {
                     if let Some(indi) = tree.individuals.get(indi_xref) {
-                        let birth_year = indi
-                            .birth
-                            .as_ref()
-                            .and_then(|e| e.date.as_ref())
-                            .and_then(|d| d.year);
-                        if let Some(b) = birth_year {
+                        if let Some(b) = indi.birth_year() {
                             if marr_year < b {
                                 out.push(date_issue(format!(
                                     "Family {}: marriage year {} precedes {} {} birth year {}",
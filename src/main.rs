@@ -186,11 +186,11 @@ fn main() -> Result<()> {
                 })?;
 
             let tree = load_tree(&file)?;
-            let mut values = ftree::render::list::extract(&tree, list_field);
-
-            if unique {
-                values = ftree::render::list::unique_sorted(values);
-            }
+            let values = if unique {
+                ftree::render::list::extract_unique(&tree, list_field)
+            } else {
+                ftree::render::list::extract(&tree, list_field)
+            };
 
             for value in &values {
                 println!("{}", value);
@@ -62,6 +62,13 @@ pub struct Event {
     pub place: Option<Place>,
 }
 
+impl Event {
+    /// Year of the event's date, if it has a parseable one.
+    pub fn year(&self) -> Option<i32> {
+        self.date.as_ref().and_then(|d| d.year)
+    }
+}
+
 /// An individual person record.
 #[derive(Debug, Clone)]
 pub struct Individual {
@@ -131,6 +138,16 @@ impl Individual {
             None => &self.xref,
         }
     }
+
+    /// Birth year, if the birth date has a parseable year.
+    pub fn birth_year(&self) -> Option<i32> {
+        self.birth.as_ref().and_then(Event::year)
+    }
+
+    /// Death year, if the death date has a parseable year.
+    pub fn death_year(&self) -> Option<i32> {
+        self.death.as_ref().and_then(Event::year)
+    }
 }
 
 #[cfg(test)]
@@ -177,4 +194,19 @@ mod tests {
         assert_eq!(n.given, Some("Windows".to_string()));
         assert_eq!(n.surname, Some("2.0".to_string()));
     }
+
+    #[test]
+    fn test_birth_and_death_year() {
+        let mut indi = Individual::new("@I1@".to_string());
+        indi.birth = Some(Event {
+            date: Some(Date::parse("ABT 1850")),
+            place: None,
+        });
+        indi.death = Some(Event {
+            date: None,
+            place: Some(Place::new("Boston")),
+        });
+        assert_eq!(indi.birth_year(), Some(1850));
+        assert_eq!(indi.death_year(), None);
+    }
 }
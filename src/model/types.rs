@@ -70,7 +70,9 @@ impl Date {
             };
         }
 
-        let upper = raw.to_uppercase();
+        // ASCII-only uppercasing keeps byte offsets aligned with `raw`, so
+        // positions found in `upper` can slice `raw` safely
+        let upper = raw.to_ascii_uppercase();
 
         // BET...AND range
         if upper.starts_with("BET ") {
@@ -335,23 +337,17 @@ pub struct NoteRef {
     pub xref: Option<String>,
 }
 
+/// GEDCOM month abbreviations, in calendar order.
+const MONTHS: [&str; 12] = [
+    "JAN", "FEB", "MAR", "APR", "MAY", "JUN", "JUL", "AUG", "SEP", "OCT", "NOV", "DEC",
+];
+
 /// Parse month abbreviation to 1-12.
 fn parse_month(s: &str) -> Option<u8> {
-    match s.to_uppercase().as_str() {
-        "JAN" => Some(1),
-        "FEB" => Some(2),
-        "MAR" => Some(3),
-        "APR" => Some(4),
-        "MAY" => Some(5),
-        "JUN" => Some(6),
-        "JUL" => Some(7),
-        "AUG" => Some(8),
-        "SEP" => Some(9),
-        "OCT" => Some(10),
-        "NOV" => Some(11),
-        "DEC" => Some(12),
-        _ => None,
-    }
+    MONTHS
+        .iter()
+        .position(|m| m.eq_ignore_ascii_case(s))
+        .map(|i| i as u8 + 1)
 }
 
 /// Parse date parts from a string like "1 Jan 1900", "Jan 1900", or "1900".
@@ -370,27 +366,26 @@ fn parse_date_parts(s: &str) -> (Option<i32>, Option<u8>, Option<u8>) {
         s
     };
 
-    let parts: Vec<&str> = s.split_whitespace().collect();
+    // At most three parts are meaningful; walk them without collecting
+    let mut parts = s.split_whitespace();
+    let first = parts.next();
+    let second = parts.next();
+    let third = parts.next();
+    if parts.next().is_some() {
+        return (None, None, None);
+    }
 
-    match parts.len() {
+    match (first, second, third) {
         // "1900"
-        1 => {
-            let year = parts[0].parse::<i32>().ok();
-            (year, None, None)
-        }
+        (Some(year), None, None) => (year.parse::<i32>().ok(), None, None),
         // "Jan 1900"
-        2 => {
-            let month = parse_month(parts[0]);
-            let year = parts[1].parse::<i32>().ok();
-            (year, month, None)
-        }
+        (Some(month), Some(year), None) => (year.parse::<i32>().ok(), parse_month(month), None),
         // "1 Jan 1900"
-        3 => {
-            let day = parts[0].parse::<u8>().ok();
-            let month = parse_month(parts[1]);
-            let year = parts[2].parse::<i32>().ok();
-            (year, month, day)
-        }
+        (Some(day), Some(month), Some(year)) => (
+            year.parse::<i32>().ok(),
+            parse_month(month),
+            day.parse::<u8>().ok(),
+        ),
         _ => (None, None, None),
     }
 }
@@ -399,6 +394,18 @@ fn parse_date_parts(s: &str) -> (Option<i32>, Option<u8>, Option<u8>) {
 mod tests {
     use super::*;
 
+    #[test]
+    fn test_parse_date_parts_counts() {
+        assert_eq!(parse_date_parts("1900"), (Some(1900), None, None));
+        assert_eq!(parse_date_parts("Jan 1900"), (Some(1900), Some(1), None));
+        assert_eq!(
+            parse_date_parts("@#DJULIAN@ 1 Jan 1900"),
+            (Some(1900), Some(1), Some(1))
+        );
+        assert_eq!(parse_date_parts("1 Jan 1900 extra"), (None, None, None));
+        assert_eq!(parse_date_parts(""), (None, None, None));
+    }
+
     #[test]
     fn test_parse_exact_date() {
         let d = Date::parse("1 Jan 1900");
@@ -454,6 +461,21 @@ mod tests {
         assert_eq!(d.day, Some(1));
     }
 
+    #[test]
+    fn test_parse_between_non_ascii_phrase() {
+        // Full Unicode uppercasing turns "ı" (2 bytes) into "I" (1 byte), which
+        // would shift byte offsets; ASCII-only uppercasing keeps them aligned
+        let d = Date::parse("bet ıı 1820 and 1825");
+        assert_eq!(d.modifier, Some(DateModifier::Between("1825".to_string())));
+    }
+
+    #[test]
+    fn test_parse_lowercase_month() {
+        let d = Date::parse("3 feb 1901");
+        assert_eq!(d.month, Some(2));
+        assert_eq!(parse_month("Sept"), None);
+    }
+
     #[test]
     fn test_parse_from_to() {
         let d = Date::parse("FROM 1 MAR 1900 TO 15 APR 1900");
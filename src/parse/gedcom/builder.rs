@@ -184,10 +184,13 @@ fn build_individual(
             }
             "SEX" => {
                 if let Some(ref v) = token.value {
-                    indi.sex = Some(match v.trim().to_uppercase().as_str() {
-                        "M" => Sex::Male,
-                        "F" => Sex::Female,
-                        _ => Sex::Unknown,
+                    let v = v.trim();
+                    indi.sex = Some(if v.eq_ignore_ascii_case("M") {
+                        Sex::Male
+                    } else if v.eq_ignore_ascii_case("F") {
+                        Sex::Female
+                    } else {
+                        Sex::Unknown
                     });
                 }
             }
@@ -16,9 +16,12 @@ pub struct Token {
 /// Tokenize a GEDCOM string into a sequence of tokens.
 ///
 /// Handles CONT and CONC continuation lines by merging them
-/// into the parent token's value.
+/// into the parent token's value as each line is read, so no
+/// intermediate list of raw tokens is built.
 pub fn tokenize(input: &str) -> Vec<Token> {
-    let mut raw_tokens = Vec::new();
+    let mut tokens: Vec<Token> = Vec::new();
+    // A BOM can only lead the file, so strip it once rather than per line
+    let input = input.strip_prefix('\u{feff}').unwrap_or(input);
 
     for (line_idx, line) in input.lines().enumerate() {
         let line = line.trim_end();
@@ -27,99 +30,65 @@ pub fn tokenize(input: &str) -> Vec<Token> {
         }
 
         if let Some(token) = parse_line(line, line_idx + 1) {
-            raw_tokens.push(token);
+            push_token(&mut tokens, token);
         }
     }
 
-    // Merge CONT and CONC into their parent tokens
-    merge_continuations(raw_tokens)
+    tokens
 }
 
 /// Parse a single GEDCOM line into a Token.
+///
+/// Lines have the shape `level [@xref@] tag [value]`; each part is split off
+/// once in order rather than re-splitting the remainder per case.
 fn parse_line(line: &str, line_number: usize) -> Option<Token> {
-    let line = line.trim_start_matches('\u{feff}'); // strip BOM if present on first line
-
-    let mut parts = line.splitn(2, ' ');
-    let level_str = parts.next()?;
+    let (level_str, rest) = line.split_once(' ')?;
     let level: u8 = level_str.parse().ok()?;
+    let rest = rest.trim();
 
-    let rest = parts.next()?.trim();
-    if rest.is_empty() {
-        return Some(Token {
-            level,
-            xref: None,
-            tag: String::new(),
-            value: None,
-            line_number,
-        });
-    }
-
-    // Check for xref: starts with @, and is at level 0
-    if rest.starts_with('@') {
-        // Find end of xref
-        if let Some(at_end) = rest[1..].find('@') {
-            let xref = rest[..at_end + 2].to_string();
-            let after_xref = rest[at_end + 2..].trim();
-
-            // Split remaining into tag and optional value
-            let mut tag_parts = after_xref.splitn(2, ' ');
-            let tag = tag_parts.next().unwrap_or("").to_uppercase();
-            let value = tag_parts.next().map(|v| v.to_string());
-
-            return Some(Token {
-                level,
-                xref: Some(xref),
-                tag,
-                value,
-                line_number,
-            });
-        }
-    }
+    // Optional xref (e.g. "@I1@"), normally only on level-0 records
+    let (xref, rest) = match rest.strip_prefix('@').and_then(|r| r.find('@')) {
+        Some(at_end) => (Some(rest[..at_end + 2].to_string()), rest[at_end + 2..].trim()),
+        None => (None, rest),
+    };
 
-    // No xref: split into tag and optional value
-    let mut tag_parts = rest.splitn(2, ' ');
-    let tag = tag_parts.next().unwrap_or("").to_uppercase();
-    let value = tag_parts.next().map(|v| v.to_string());
+    // Tag and optional value; tags are ASCII by spec
+    let (tag, value) = match rest.split_once(' ') {
+        Some((tag, value)) => (tag, Some(value.to_string())),
+        None => (rest, None),
+    };
 
     Some(Token {
         level,
-        xref: None,
-        tag,
+        xref,
+        tag: tag.to_ascii_uppercase(),
         value,
         line_number,
     })
 }
 
-/// Merge CONT and CONC tokens into their parent token's value.
-fn merge_continuations(tokens: Vec<Token>) -> Vec<Token> {
-    let mut result: Vec<Token> = Vec::with_capacity(tokens.len());
-
-    for token in tokens {
-        match token.tag.as_str() {
-            "CONT" => {
-                if let Some(parent) = result.last_mut() {
-                    let parent_val = parent.value.get_or_insert_with(String::new);
-                    parent_val.push('\n');
-                    if let Some(ref val) = token.value {
-                        parent_val.push_str(val);
-                    }
+/// Append a token, merging CONT and CONC into the previous token's value.
+fn push_token(tokens: &mut Vec<Token>, token: Token) {
+    match token.tag.as_str() {
+        "CONT" => {
+            if let Some(parent) = tokens.last_mut() {
+                let parent_val = parent.value.get_or_insert_with(String::new);
+                parent_val.push('\n');
+                if let Some(ref val) = token.value {
+                    parent_val.push_str(val);
                 }
             }
-            "CONC" => {
-                if let Some(parent) = result.last_mut() {
-                    if let Some(ref val) = token.value {
-                        let parent_val = parent.value.get_or_insert_with(String::new);
-                        parent_val.push_str(val);
-                    }
+        }
+        "CONC" => {
+            if let Some(parent) = tokens.last_mut() {
+                if let Some(ref val) = token.value {
+                    let parent_val = parent.value.get_or_insert_with(String::new);
+                    parent_val.push_str(val);
                 }
             }
-            _ => {
-                result.push(token);
-            }
         }
+        _ => tokens.push(token),
     }
-
-    result
 }
 
 #[cfg(test)]
@@ -183,6 +152,20 @@ mod tests {
         assert_eq!(t.tag, "NAME");
     }
 
+    #[test]
+    fn test_parse_unterminated_xref_and_bare_level() {
+        // "@" without a closing "@" is treated as the tag, not an xref
+        let t = parse_line("1 @BAD value", 1).unwrap();
+        assert_eq!(t.xref, None);
+        assert_eq!(t.tag, "@BAD");
+        assert_eq!(t.value, Some("value".to_string()));
+
+        let t = parse_line("1 ", 1).unwrap();
+        assert_eq!(t.tag, "");
+        assert_eq!(t.value, None);
+        assert!(parse_line("1", 1).is_none());
+    }
+
     #[test]
     fn test_cont_merging() {
         let tokens = tokenize("1 NOTE First line\n2 CONT Second line\n2 CONT Third line");
@@ -210,6 +193,14 @@ mod tests {
         assert_eq!(tokens[5].tag, "TRLR");
     }
 
+    #[test]
+    fn test_leading_bom_stripped() {
+        let tokens = tokenize("\u{feff}0 HEAD\n1 CHAR UTF-8\n");
+        assert_eq!(tokens.len(), 2);
+        assert_eq!(tokens[0].level, 0);
+        assert_eq!(tokens[0].tag, "HEAD");
+    }
+
     #[test]
     fn test_empty_lines_skipped() {
         let tokens = tokenize("0 HEAD\n\n0 TRLR\n");
@@ -1,8 +1,9 @@
+use std::collections::HashSet;
 use std::fmt::Write as FmtWrite;
 use std::fs;
 use std::path::Path;
 
-use crate::model::FamilyTree;
+use crate::model::{FamilyTree, Individual};
 use crate::render::{RenderError, Renderer};
 
 /// Layout orientation for ASCII tree rendering.
@@ -54,12 +55,7 @@ impl AsciiRenderer {
             }
             match self.layout {
                 Layout::Horizontal => render_horizontal(&mut out, tree, root_xref, "", true),
-                Layout::TopDown => {
-                    let lines = render_topdown_tree(tree, root_xref);
-                    for line in lines {
-                        let _ = writeln!(out, "{}", line);
-                    }
-                }
+                Layout::TopDown => render_topdown_family(&mut out, tree, root_xref, 0),
             }
         }
         out
@@ -70,41 +66,32 @@ impl AsciiRenderer {
 /// Returns xrefs sorted for deterministic output.
 /// If an individual has family_as_spouse entries, they're preferred as roots.
 pub fn find_root_families(tree: &FamilyTree) -> Vec<String> {
-    let mut roots: Vec<String> = tree
-        .individuals
-        .values()
-        .filter(|i| i.family_as_child.is_empty())
-        .filter(|i| !i.family_as_spouse.is_empty())
-        .map(|i| i.xref.clone())
-        .collect();
-
-    roots.sort();
-    roots.dedup();
+    // One scan gathers both parentless spouses and the no-family fallback
+    let mut roots: Vec<&Individual> = Vec::new();
+    let mut unattached: Vec<&Individual> = Vec::new();
+    for indi in tree.individuals.values().filter(|i| i.family_as_child.is_empty()) {
+        if indi.family_as_spouse.is_empty() {
+            unattached.push(indi);
+        } else {
+            roots.push(indi);
+        }
+    }
 
     // If no roots with families found, fall back to any individual with no parents
     if roots.is_empty() {
-        roots = tree
-            .individuals
-            .values()
-            .filter(|i| i.family_as_child.is_empty())
-            .map(|i| i.xref.clone())
-            .collect();
-        roots.sort();
+        roots = unattached;
     }
+    roots.sort_by(|a, b| a.xref.cmp(&b.xref));
 
     // Deduplicate: if both husband and wife of same family are roots,
     // keep only the husband (or first alphabetically) to avoid duplicate trees
-    let mut seen_families = std::collections::HashSet::new();
+    let mut seen_families: HashSet<&str> = HashSet::new();
     let mut deduped = Vec::new();
-    for xref in &roots {
-        if let Some(indi) = tree.individuals.get(xref) {
-            let dominated = indi.family_as_spouse.iter().any(|f| seen_families.contains(f));
-            if !dominated {
-                for f in &indi.family_as_spouse {
-                    seen_families.insert(f.clone());
-                }
-                deduped.push(xref.clone());
-            }
+    for indi in roots {
+        let dominated = indi.family_as_spouse.iter().any(|f| seen_families.contains(f.as_str()));
+        if !dominated {
+            seen_families.extend(indi.family_as_spouse.iter().map(String::as_str));
+            deduped.push(indi.xref.clone());
         }
     }
 
@@ -112,11 +99,12 @@ pub fn find_root_families(tree: &FamilyTree) -> Vec<String> {
 }
 
 /// Get display label for an individual: "Name" or xref fallback.
-fn label(tree: &FamilyTree, xref: &str) -> String {
+/// Borrows from the tree, so repeated appearances cost no allocation.
+fn label<'a>(tree: &'a FamilyTree, xref: &'a str) -> &'a str {
     tree.individuals
         .get(xref)
-        .map(|i| i.display_name().to_string())
-        .unwrap_or_else(|| xref.to_string())
+        .map(Individual::display_name)
+        .unwrap_or(xref)
 }
 
 /// Get the spouse xref for a given individual in a given family.
@@ -132,6 +120,13 @@ fn spouse_in_family<'a>(tree: &'a FamilyTree, indi_xref: &str, fam_xref: &str) -
 
 // ─── Horizontal layout ──────────────────────────────────────────────
 
+/// Tree connectors: branch glyphs before a name, and the indent that
+/// continues beneath it for nested children.
+const BRANCH_MID: &str = "├── ";
+const BRANCH_LAST: &str = "└── ";
+const INDENT_MID: &str = "│   ";
+const INDENT_LAST: &str = "    ";
+
 /// Entry point for horizontal rendering of one root.
 fn render_horizontal(out: &mut String, tree: &FamilyTree, xref: &str, prefix: &str, is_last: bool) {
     render_horiz_node(out, tree, xref, prefix, is_last, true);
@@ -154,63 +149,57 @@ fn render_horiz_node(
 
     let person_label = label(tree, xref);
 
+    // Connector before the name, and the indent that continues below it
+    let (connector, spacer) = if is_root_call {
+        ("", "")
+    } else if is_last {
+        (BRANCH_LAST, INDENT_LAST)
+    } else {
+        (BRANCH_MID, INDENT_MID)
+    };
+
     if indi.family_as_spouse.is_empty() {
         // Leaf: no families
-        let connector = if is_root_call {
-            ""
-        } else if is_last {
-            "└── "
-        } else {
-            "├── "
-        };
         let _ = writeln!(out, "{}{}{}", prefix, connector, person_label);
         return;
     }
 
+    // Prefix for children is the same for every family
+    let child_prefix = if is_root_call {
+        String::new()
+    } else {
+        format!("{}{}", prefix, spacer)
+    };
+
+    let last_family = indi.family_as_spouse.len() - 1;
     for (fi, fam_xref) in indi.family_as_spouse.iter().enumerate() {
         let fam = match tree.families.get(fam_xref) {
             Some(f) => f,
             None => continue,
         };
 
-        let spouse_label = spouse_in_family(tree, xref, fam_xref)
-            .map(|sx| format!(" ── {}", label(tree, sx)))
-            .unwrap_or_default();
+        let spouse = spouse_in_family(tree, xref, fam_xref).map(|sx| label(tree, sx));
 
         if fi == 0 {
-            let connector = if is_root_call {
-                ""
-            } else if is_last {
-                "└── "
-            } else {
-                "├── "
-            };
-            let _ = writeln!(out, "{}{}{}{}", prefix, connector, person_label, spouse_label);
+            let _ = write!(out, "{}{}{}", prefix, connector, person_label);
         } else {
-            // Additional marriages on separate line
-            let spacer = if is_root_call {
-                ""
-            } else if is_last {
-                "    "
-            } else {
-                "│   "
-            };
-            let padding = " ".repeat(person_label.len());
-            let _ = writeln!(out, "{}{}{}{}", prefix, spacer, padding, spouse_label);
+            // Additional marriages on separate line, padded under the
+            // person's name so the spouse lines up
+            let _ = write!(out, "{}{}{:width$}", prefix, spacer, "", width = person_label.len());
+        }
+        if let Some(spouse) = spouse {
+            let _ = write!(out, " ── {}", spouse);
         }
+        out.push('\n');
 
-        // Build prefix for children
-        let child_prefix = if is_root_call {
-            String::new()
-        } else if is_last {
-            format!("{}    ", prefix)
+        // Only the last child of the last family closes the branch
+        let last_child = if fi == last_family {
+            fam.children.len().checked_sub(1)
         } else {
-            format!("{}│   ", prefix)
+            None
         };
-
         for (ci, child_xref) in fam.children.iter().enumerate() {
-            let child_is_last = ci == fam.children.len() - 1
-                && fi == indi.family_as_spouse.len() - 1;
+            let child_is_last = Some(ci) == last_child;
             render_horiz_node(out, tree, child_xref, &child_prefix, child_is_last, false);
         }
     }
@@ -218,19 +207,16 @@ fn render_horiz_node(
 
 // ─── Top-down box layout ────────────────────────────────────────────
 
-/// A positioned box in the top-down layout.
-struct BoxNode {
-    text: String,
+/// A positioned box in the top-down layout. Borrows its label from the tree.
+struct BoxNode<'a> {
+    text: &'a str,
     width: usize,
 }
 
-impl BoxNode {
-    fn new(text: &str) -> Self {
+impl<'a> BoxNode<'a> {
+    fn new(text: &'a str) -> Self {
         let width = text.len() + 4; // "│ " + text + " │"
-        BoxNode {
-            text: text.to_string(),
-            width,
-        }
+        BoxNode { text, width }
     }
 
     fn render_top(&self) -> String {
@@ -246,14 +232,8 @@ impl BoxNode {
     }
 }
 
-/// Render a top-down tree for a root ancestor, returning lines.
-fn render_topdown_tree(tree: &FamilyTree, root_xref: &str) -> Vec<String> {
-    let mut lines = Vec::new();
-    render_topdown_family(&mut lines, tree, root_xref, 0);
-    lines
-}
-
-fn render_topdown_family(lines: &mut Vec<String>, tree: &FamilyTree, xref: &str, depth: usize) {
+/// Render a top-down tree for an ancestor, writing lines straight into `out`.
+fn render_topdown_family(out: &mut String, tree: &FamilyTree, xref: &str, depth: usize) {
     let indi = match tree.individuals.get(xref) {
         Some(i) => i,
         None => return,
@@ -268,21 +248,21 @@ fn render_topdown_family(lines: &mut Vec<String>, tree: &FamilyTree, xref: &str,
         };
 
         // Couple boxes
-        let person_box = BoxNode::new(&label(tree, xref));
+        let person_box = BoxNode::new(label(tree, xref));
         let spouse_box = spouse_in_family(tree, xref, fam_xref)
-            .map(|sx| BoxNode::new(&label(tree, sx)));
+            .map(|sx| BoxNode::new(label(tree, sx)));
 
         match &spouse_box {
             Some(sb) => {
                 let gap = "   ";
-                lines.push(format!("{}{}{}{}", indent, person_box.render_top(), gap, sb.render_top()));
-                lines.push(format!("{}{}───{}", indent, person_box.render_mid(), sb.render_mid()));
-                lines.push(format!("{}{}{}{}", indent, person_box.render_bot(), gap, sb.render_bot()));
+                let _ = writeln!(out, "{}{}{}{}", indent, person_box.render_top(), gap, sb.render_top());
+                let _ = writeln!(out, "{}{}───{}", indent, person_box.render_mid(), sb.render_mid());
+                let _ = writeln!(out, "{}{}{}{}", indent, person_box.render_bot(), gap, sb.render_bot());
             }
             None => {
-                lines.push(format!("{}{}", indent, person_box.render_top()));
-                lines.push(format!("{}{}", indent, person_box.render_mid()));
-                lines.push(format!("{}{}", indent, person_box.render_bot()));
+                let _ = writeln!(out, "{}{}", indent, person_box.render_top());
+                let _ = writeln!(out, "{}{}", indent, person_box.render_mid());
+                let _ = writeln!(out, "{}{}", indent, person_box.render_bot());
             }
         }
 
@@ -290,18 +270,19 @@ fn render_topdown_family(lines: &mut Vec<String>, tree: &FamilyTree, xref: &str,
         if !fam.children.is_empty() {
             let couple_center = indent.len() + person_box.width / 2;
             let center_pad = " ".repeat(couple_center);
-            lines.push(format!("{}│", center_pad));
+            let _ = writeln!(out, "{}│", center_pad);
 
+            let last_child = fam.children.len() - 1;
             for (ci, child_xref) in fam.children.iter().enumerate() {
-                let is_last = ci == fam.children.len() - 1;
-                let connector = if is_last { "└── " } else { "├── " };
+                let is_last = ci == last_child;
+                let connector = if is_last { BRANCH_LAST } else { BRANCH_MID };
                 let child_label = label(tree, child_xref);
-                lines.push(format!("{}{}{}", center_pad, connector, child_label));
+                let _ = writeln!(out, "{}{}{}", center_pad, connector, child_label);
 
                 // Recurse for children who have their own families
                 if let Some(child) = tree.individuals.get(child_xref.as_str()) {
                     if !child.family_as_spouse.is_empty() {
-                        render_topdown_family(lines, tree, child_xref, depth + 1);
+                        render_topdown_family(out, tree, child_xref, depth + 1);
                     }
                 }
             }
@@ -310,10 +291,10 @@ fn render_topdown_family(lines: &mut Vec<String>, tree: &FamilyTree, xref: &str,
 
     // Individual with no families
     if indi.family_as_spouse.is_empty() {
-        let person_box = BoxNode::new(&label(tree, xref));
-        lines.push(format!("{}{}", indent, person_box.render_top()));
-        lines.push(format!("{}{}", indent, person_box.render_mid()));
-        lines.push(format!("{}{}", indent, person_box.render_bot()));
+        let person_box = BoxNode::new(label(tree, xref));
+        let _ = writeln!(out, "{}{}", indent, person_box.render_top());
+        let _ = writeln!(out, "{}{}", indent, person_box.render_mid());
+        let _ = writeln!(out, "{}{}", indent, person_box.render_bot());
     }
 }
 
@@ -432,6 +413,29 @@ mod tests {
         assert!(output.contains("John Smith"));
         assert!(output.contains("Tom Smith"));
         assert!(output.contains("Mary Jones"));
+        // Grandchild is indented under a continuing branch
+        assert!(output.contains("├── Robert Smith ── Mary Jones\n│   └── Tom Smith\n"));
+    }
+
+    #[test]
+    fn test_horizontal_second_marriage_aligned() {
+        let mut tree = make_test_tree();
+        let mut sue = Individual::new("@I7@".to_string());
+        sue.name = Some(Name::from_gedcom("Sue /Brown/"));
+        sue.family_as_spouse.push("@F3@".to_string());
+        tree.individuals.insert("@I7@".to_string(), sue);
+        tree.individuals.get_mut("@I1@").unwrap().family_as_spouse.push("@F3@".to_string());
+        let mut fam = Family::new("@F3@".to_string());
+        fam.husband = Some("@I1@".to_string());
+        fam.wife = Some("@I7@".to_string());
+        tree.families.insert("@F3@".to_string(), fam);
+
+        let renderer = AsciiRenderer { layout: Layout::Horizontal };
+        let output = renderer.render_to_string(&tree);
+        let lines: Vec<&str> = output.lines().collect();
+        assert_eq!(lines[0], "John Smith ── Jane Doe");
+        // Second spouse is padded to sit under the first
+        assert_eq!(lines[3], "           ── Sue Brown");
     }
 
     #[test]
@@ -60,6 +60,7 @@ pub fn render_csv(tree: &FamilyTree) -> String {
 
 fn render_row(out: &mut String, indi: &Individual, tree: &FamilyTree) {
     let name = indi.name.as_ref();
+    let (father, mother) = resolve_parent_names(indi, tree);
 
     let fields: Vec<String> = vec![
         csv_escape(&indi.xref),
@@ -115,8 +116,8 @@ fn render_row(out: &mut String, indi: &Individual, tree: &FamilyTree) {
                 .unwrap_or(""),
         ),
         csv_escape(indi.occupation.as_deref().unwrap_or("")),
-        csv_escape(&resolve_parent_name(indi, tree, ParentRole::Father)),
-        csv_escape(&resolve_parent_name(indi, tree, ParentRole::Mother)),
+        csv_escape(father),
+        csv_escape(mother),
         csv_escape(&resolve_spouse_names(indi, tree)),
         csv_escape(&resolve_source_titles(indi, tree)),
     ];
@@ -124,26 +125,31 @@ fn render_row(out: &mut String, indi: &Individual, tree: &FamilyTree) {
     let _ = writeln!(out, "{}", fields.join(","));
 }
 
-enum ParentRole {
-    Father,
-    Mother,
-}
+/// Resolve father and mother names in one pass over the child's families.
+/// Each parent comes from the first family that names a known individual
+/// in that role.
+fn resolve_parent_names<'a>(indi: &Individual, tree: &'a FamilyTree) -> (&'a str, &'a str) {
+    let mut father = None;
+    let mut mother = None;
 
-fn resolve_parent_name(indi: &Individual, tree: &FamilyTree, role: ParentRole) -> String {
     for fam_xref in &indi.family_as_child {
         if let Some(fam) = tree.families.get(fam_xref) {
-            let parent_xref = match role {
-                ParentRole::Father => fam.husband.as_deref(),
-                ParentRole::Mother => fam.wife.as_deref(),
-            };
-            if let Some(xref) = parent_xref {
-                if let Some(parent) = tree.individuals.get(xref) {
-                    return parent.display_name().to_string();
-                }
+            if father.is_none() {
+                father = fam.husband.as_deref().and_then(|x| tree.individuals.get(x));
+            }
+            if mother.is_none() {
+                mother = fam.wife.as_deref().and_then(|x| tree.individuals.get(x));
+            }
+            if father.is_some() && mother.is_some() {
+                break;
             }
         }
     }
-    String::new()
+
+    (
+        father.map(Individual::display_name).unwrap_or(""),
+        mother.map(Individual::display_name).unwrap_or(""),
+    )
 }
 
 fn resolve_spouse_names(indi: &Individual, tree: &FamilyTree) -> String {
@@ -304,6 +310,20 @@ mod tests {
         assert!(robert_line.contains("Jane Doe"));
     }
 
+    #[test]
+    fn test_csv_parents_from_separate_families() {
+        let mut tree = make_test_tree();
+        // A family with only a mother listed ahead of the full one
+        let mut fam = Family::new("@F0@".to_string());
+        fam.wife = Some("@I2@".to_string());
+        tree.families.insert("@F0@".to_string(), fam);
+        let bob = tree.individuals.get_mut("@I3@").unwrap();
+        bob.family_as_child.insert(0, "@F0@".to_string());
+
+        let bob = &tree.individuals["@I3@"];
+        assert_eq!(resolve_parent_names(bob, &tree), ("John Smith", "Jane Doe"));
+    }
+
     #[test]
     fn test_csv_spouse_names() {
         let tree = make_test_tree();
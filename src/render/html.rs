@@ -1,8 +1,10 @@
-use std::fmt::Write as FmtWrite;
+use std::borrow::Cow;
+use std::collections::HashMap;
+use std::fmt::{self, Write as FmtWrite};
 use std::fs;
 use std::path::Path;
 
-use crate::model::{FamilyTree, Individual, NoteRef, Sex};
+use crate::model::{Event, FamilyTree, Individual, NoteRef, Sex};
 use crate::render::{RenderError, Renderer};
 use crate::render::svg::render_svg;
 
@@ -28,23 +30,24 @@ impl Renderer for HtmlRenderer {
 
 /// Generate the full HTML document.
 pub fn render_html(tree: &FamilyTree, embed_svg: bool) -> String {
-    let mut out = String::new();
-
-    // Sort individuals by name for deterministic output
-    let mut xrefs: Vec<&String> = tree.individuals.keys().collect();
-    xrefs.sort_by_key(|x| {
-        tree.individuals[*x].display_name().to_lowercase()
-    });
-
-    out.push_str("<!DOCTYPE html>\n");
-    out.push_str("<html lang=\"en\">\n");
-    out.push_str("<head>\n");
-    out.push_str("  <meta charset=\"UTF-8\">\n");
-    out.push_str("  <meta name=\"viewport\" content=\"width=device-width, initial-scale=1.0\">\n");
-    out.push_str("  <title>Family Tree</title>\n");
+    // Reserve for the static markup plus a rough per-person estimate
+    // (one table row and one detail card) to avoid repeated regrowth
+    let mut out = String::with_capacity(
+        HEAD.len() + CSS.len() + TABLE_HEAD.len() + JS.len() + tree.individuals.len() * 1024,
+    );
+
+    // Sort individuals by name for deterministic output. The lowercased name is
+    // computed once per person and reused as the row's search key.
+    let mut people: Vec<(String, &String, &Individual)> = tree
+        .individuals
+        .iter()
+        .map(|(xref, indi)| (indi.display_name().to_lowercase(), xref, indi))
+        .collect();
+    people.sort_by(|a, b| a.0.cmp(&b.0));
+
+    out.push_str(HEAD);
     out.push_str(CSS);
-    out.push_str("</head>\n");
-    out.push_str("<body>\n");
+    out.push_str("</head>\n<body>\n");
 
     // Header
     let _ = writeln!(
@@ -65,36 +68,33 @@ pub fn render_html(tree: &FamilyTree, embed_svg: bool) -> String {
         out.push_str("  </section>\n");
     }
 
-    // Search bar
-    out.push_str(r#"  <div class="search-bar">
-    <input type="text" id="search" placeholder="Search by name&hellip;" oninput="filterTable(this.value)" aria-label="Search individuals">
-  </div>
-"#);
-
-    // Summary table
-    out.push_str("  <section class=\"table-section\">\n");
-    out.push_str("    <table id=\"individuals-table\">\n");
-    out.push_str("      <thead>\n        <tr>\n");
-    out.push_str("          <th>Name</th><th>Sex</th><th>Born</th><th>Died</th><th>Father</th><th>Mother</th>\n");
-    out.push_str("        </tr>\n      </thead>\n      <tbody>\n");
-
-    for xref in &xrefs {
-        let indi = &tree.individuals[*xref];
-        let anchor = xref_to_id(xref);
-        let name = html_escape(indi.display_name());
+    // Search bar and summary table header
+    out.push_str(TABLE_HEAD);
+
+    // Derive every anchor id and escaped name once; both are repeated across
+    // rows, cards and links
+    let labels = person_labels(tree);
+
+    // Resolve parents once; both the table and the detail cards need them
+    let parent_pairs: Vec<(Option<&str>, Option<&str>)> = people
+        .iter()
+        .map(|(_, _, indi)| parents(indi, tree))
+        .collect();
+
+    for ((sort_name, xref, indi), &(father, mother)) in people.iter().zip(&parent_pairs) {
+        let link = &labels[xref.as_str()].link;
         let sex = sex_label(&indi.sex);
         let birth = event_year_str(indi.birth.as_ref());
         let death = event_year_str(indi.death.as_ref());
-        let (father, mother) = parents(indi, tree);
-        let father_html = person_link(&father, tree);
-        let mother_html = person_link(&mother, tree);
+        let father_html = person_link(father, &labels);
+        let mother_html = person_link(mother, &labels);
 
         let sex_class = sex_class(&indi.sex);
 
         let _ = writeln!(
             out,
-            "        <tr data-name=\"{}\">\n          <td><a href=\"#{anchor}\">{name}</a></td>\n          <td class=\"{sex_class}\">{sex}</td><td>{birth}</td><td>{death}</td><td>{father_html}</td><td>{mother_html}</td>\n        </tr>",
-            indi.display_name().to_lowercase()
+            "        <tr data-name=\"{}\">\n          <td>{link}</td>\n          <td class=\"{sex_class}\">{sex}</td><td>{birth}</td><td>{death}</td><td>{father_html}</td><td>{mother_html}</td>\n        </tr>",
+            html_escape(sort_name)
         );
     }
 
@@ -103,9 +103,8 @@ pub fn render_html(tree: &FamilyTree, embed_svg: bool) -> String {
     // Individual detail cards
     out.push_str("  <section class=\"details\">\n");
 
-    for xref in &xrefs {
-        let indi = &tree.individuals[*xref];
-        render_individual_section(&mut out, indi, xref, tree);
+    for ((_, xref, indi), &parent_pair) in people.iter().zip(&parent_pairs) {
+        render_individual_section(&mut out, indi, xref, parent_pair, &labels, tree);
     }
 
     out.push_str("  </section>\n");
@@ -117,68 +116,70 @@ pub fn render_html(tree: &FamilyTree, embed_svg: bool) -> String {
     out
 }
 
-fn render_individual_section(out: &mut String, indi: &Individual, xref: &str, tree: &FamilyTree) {
-    let anchor = xref_to_id(xref);
-    let name = html_escape(indi.display_name());
-    let sex_class = sex_class(&indi.sex);
+fn render_individual_section(
+    out: &mut String,
+    indi: &Individual,
+    xref: &str,
+    (father_xref, mother_xref): (Option<&str>, Option<&str>),
+    labels: &HashMap<&str, PersonLabel>,
+    tree: &FamilyTree,
+) {
+    let PersonLabel { anchor, name, .. } = &labels[xref];
+    let card_class = card_class(&indi.sex);
 
-    let _ = writeln!(out, "    <article class=\"person-card {sex_class}\" id=\"{anchor}\">");
-    let _ = writeln!(out, "      <h2>{name}</h2>");
+    let _ = writeln!(
+        out,
+        "    <article class=\"{card_class}\" id=\"{anchor}\">\n      <h2>{name}</h2>"
+    );
 
-    // Vital events
-    let mut has_vitals = false;
-    let mut vitals = String::new();
+    // Vital events, written in place; the opening tag is rolled back if no
+    // field turns out to have a value
+    const VITALS_OPEN: &str = "      <dl class=\"vitals\">";
+    let vitals_start = out.len();
+    out.push_str(VITALS_OPEN);
 
     if let Some(ref e) = indi.birth {
-        push_field(&mut vitals, "Born", &format_event(e));
-        has_vitals = true;
+        push_event_field(out, "Born", e);
     }
     if let Some(ref e) = indi.christening {
-        push_field(&mut vitals, "Christened", &format_event(e));
-        has_vitals = true;
+        push_event_field(out, "Christened", e);
     }
     if let Some(ref e) = indi.adoption {
-        push_field(&mut vitals, "Adopted", &format_event(e));
-        has_vitals = true;
+        push_event_field(out, "Adopted", e);
     }
     if let Some(ref e) = indi.death {
-        push_field(&mut vitals, "Died", &format_event(e));
-        has_vitals = true;
+        push_event_field(out, "Died", e);
     }
     if let Some(ref e) = indi.burial {
-        push_field(&mut vitals, "Buried", &format_event(e));
-        has_vitals = true;
+        push_event_field(out, "Buried", e);
     }
     if let Some(ref e) = indi.residence {
-        push_field(&mut vitals, "Residence", &format_event(e));
-        has_vitals = true;
+        push_event_field(out, "Residence", e);
     }
     if let Some(ref v) = indi.occupation {
-        push_field(&mut vitals, "Occupation", v);
-        has_vitals = true;
+        push_field(out, "Occupation", v);
     }
     if let Some(ref v) = indi.education {
-        push_field(&mut vitals, "Education", v);
-        has_vitals = true;
+        push_field(out, "Education", v);
     }
     if let Some(ref v) = indi.title {
-        push_field(&mut vitals, "Title", v);
-        has_vitals = true;
+        push_field(out, "Title", v);
     }
 
-    if has_vitals {
-        let _ = writeln!(out, "      <dl class=\"vitals\">{}</dl>", vitals);
+    if out.len() == vitals_start + VITALS_OPEN.len() {
+        out.truncate(vitals_start);
+    } else {
+        out.push_str("</dl>\n");
     }
 
     // Parents
-    let (father_xref, mother_xref) = parents(indi, tree);
     if father_xref.is_some() || mother_xref.is_some() {
         out.push_str("      <section class=\"relations\">\n        <h3>Parents</h3>\n        <ul>\n");
-        if let Some(ref fx) = father_xref {
-            let _ = writeln!(out, "          <li><span class=\"label\">Father:</span> {}</li>", person_link(&Some(fx.clone()), tree));
+        if father_xref.is_some() {
+            let _ = writeln!(out, "          <li><span class=\"label\">Father:</span> {}</li>", person_link(father_xref, labels));
         }
-        if let Some(ref mx) = mother_xref {
-            let _ = writeln!(out, "          <li><span class=\"label\">Mother:</span> {}</li>", person_link(&Some(mx.clone()), tree));
+        if mother_xref.is_some() {
+            let _ = writeln!(out, "          <li><span class=\"label\">Mother:</span> {}</li>", person_link(mother_xref, labels));
         }
         out.push_str("        </ul>\n      </section>\n");
     }
@@ -195,23 +196,23 @@ fn render_individual_section(out: &mut String, indi: &Individual, xref: &str, tr
             out.push_str("      <section class=\"relations\">\n        <h3>Spouse &amp; Children</h3>\n        <ul>\n");
 
             if let Some(sx) = spouse_xref {
-                let _ = writeln!(out, "          <li><span class=\"label\">Spouse:</span> {}</li>", person_link(&Some(sx.to_string()), tree));
+                let _ = writeln!(out, "          <li><span class=\"label\">Spouse:</span> {}</li>", person_link(Some(sx), labels));
             }
             if let Some(ref e) = fam.engagement {
-                push_li(out, "Engaged", &format_event(e));
+                push_event_li(out, "Engaged", e);
             }
             if let Some(ref e) = fam.marriage {
-                push_li(out, "Married", &format_event(e));
+                push_event_li(out, "Married", e);
             }
             if let Some(ref e) = fam.divorce {
-                push_li(out, "Divorced", &format_event(e));
+                push_event_li(out, "Divorced", e);
             }
             if let Some(ref e) = fam.annulment {
-                push_li(out, "Annulled", &format_event(e));
+                push_event_li(out, "Annulled", e);
             }
 
             for child_xref in &fam.children {
-                let _ = writeln!(out, "          <li><span class=\"label\">Child:</span> {}</li>", person_link(&Some(child_xref.clone()), tree));
+                let _ = writeln!(out, "          <li><span class=\"label\">Child:</span> {}</li>", person_link(Some(child_xref), labels));
             }
 
             out.push_str("        </ul>\n      </section>\n");
@@ -227,23 +228,24 @@ fn render_individual_section(out: &mut String, indi: &Individual, xref: &str, tr
                 .get(&citation.source_xref)
                 .map(|s| s.display_title())
                 .unwrap_or(&citation.source_xref);
-            let text = match &citation.page {
-                Some(page) => format!("{} ({})", html_escape(title), html_escape(page)),
-                None => html_escape(title),
+            let _ = match &citation.page {
+                Some(page) => writeln!(out, "          <li>{} ({})</li>", html_escape(title), html_escape(page)),
+                None => writeln!(out, "          <li>{}</li>", html_escape(title)),
             };
-            let _ = writeln!(out, "          <li>{}</li>", text);
         }
         out.push_str("        </ul>\n      </section>\n");
     }
 
     // Notes
-    if !indi.notes.is_empty() {
+    let mut note_texts = indi
+        .notes
+        .iter()
+        .filter_map(|note| resolve_note_text(note, tree))
+        .peekable();
+    if note_texts.peek().is_some() {
         out.push_str("      <section class=\"notes\">\n        <h3>Notes</h3>\n");
-        for note in &indi.notes {
-            let text = resolve_note_text(note, tree);
-            if let Some(text) = text {
-                let _ = writeln!(out, "        <p>{}</p>", html_escape(text));
-            }
+        for text in note_texts {
+            let _ = writeln!(out, "        <p>{}</p>", html_escape(text));
         }
         out.push_str("      </section>\n");
     }
@@ -253,18 +255,40 @@ fn render_individual_section(out: &mut String, indi: &Individual, xref: &str, tr
 
 // ── Helpers ──────────────────────────────────────────────────────────────────
 
-fn xref_to_id(xref: &str) -> String {
-    xref.trim_matches('@')
-        .chars()
-        .map(|c| if c.is_alphanumeric() || c == '-' { c } else { '_' })
-        .collect()
+/// Turn an xref into an HTML id. Typical xrefs (`@I1@`) are already safe
+/// once the `@` delimiters are trimmed, so they are borrowed rather than copied.
+fn xref_to_id(xref: &str) -> Cow<'_, str> {
+    let id = xref.trim_matches('@');
+    if id.chars().all(|c| c.is_alphanumeric() || c == '-') {
+        return Cow::Borrowed(id);
+    }
+    Cow::Owned(
+        id.chars()
+            .map(|c| if c.is_alphanumeric() || c == '-' { c } else { '_' })
+            .collect(),
+    )
 }
 
-fn html_escape(s: &str) -> String {
-    s.replace('&', "&amp;")
-        .replace('<', "&lt;")
-        .replace('>', "&gt;")
-        .replace('"', "&quot;")
+/// Escape text for use in element content or a double-quoted attribute.
+/// Most GEDCOM text needs no escaping, so it is borrowed unchanged; otherwise
+/// the escaped copy is built in a single pass.
+fn html_escape(s: &str) -> Cow<'_, str> {
+    let first = match s.find(['&', '<', '>', '"']) {
+        Some(i) => i,
+        None => return Cow::Borrowed(s),
+    };
+    let mut escaped = String::with_capacity(s.len() + 16);
+    escaped.push_str(&s[..first]);
+    for c in s[first..].chars() {
+        match c {
+            '&' => escaped.push_str("&amp;"),
+            '<' => escaped.push_str("&lt;"),
+            '>' => escaped.push_str("&gt;"),
+            '"' => escaped.push_str("&quot;"),
+            _ => escaped.push(c),
+        }
+    }
+    Cow::Owned(escaped)
 }
 
 fn sex_label(sex: &Option<Sex>) -> &'static str {
@@ -283,48 +307,106 @@ fn sex_class(sex: &Option<Sex>) -> &'static str {
     }
 }
 
-fn event_year_str(event: Option<&crate::model::Event>) -> String {
+/// Full class attribute for a person card.
+fn card_class(sex: &Option<Sex>) -> &'static str {
+    match sex {
+        Some(Sex::Male) => "person-card male",
+        Some(Sex::Female) => "person-card female",
+        _ => "person-card",
+    }
+}
+
+fn event_year_str(event: Option<&Event>) -> &str {
     event
         .and_then(|e| e.date.as_ref())
-        .map(|d| d.raw.clone())
-        .unwrap_or_default()
+        .map(|d| d.raw.as_str())
+        .unwrap_or("")
 }
 
-fn format_event(event: &crate::model::Event) -> String {
+/// True when an event would render as empty text (no date and no place).
+fn event_is_blank(event: &Event) -> bool {
     match (&event.date, &event.place) {
-        (Some(d), Some(p)) => format!("{}, {}", d, p),
-        (Some(d), None) => d.to_string(),
-        (None, Some(p)) => p.to_string(),
-        (None, None) => String::new(),
+        (Some(_), Some(_)) => false,
+        (Some(d), None) => d.raw.is_empty(),
+        (None, Some(p)) => p.raw.is_empty(),
+        (None, None) => true,
+    }
+}
+
+/// Append an event as escaped "date, place" text directly to `out`.
+fn push_event_text(out: &mut String, event: &Event) {
+    if let Some(ref d) = event.date {
+        out.push_str(&html_escape(&d.raw));
+        if event.place.is_some() {
+            out.push_str(", ");
+        }
+    }
+    if let Some(ref p) = event.place {
+        out.push_str(&html_escape(&p.raw));
     }
 }
 
 /// Returns (father_xref, mother_xref) for an individual.
-fn parents(indi: &Individual, tree: &FamilyTree) -> (Option<String>, Option<String>) {
+fn parents<'a>(indi: &Individual, tree: &'a FamilyTree) -> (Option<&'a str>, Option<&'a str>) {
     for fam_xref in &indi.family_as_child {
         if let Some(fam) = tree.families.get(fam_xref) {
-            return (fam.husband.clone(), fam.wife.clone());
+            return (fam.husband.as_deref(), fam.wife.as_deref());
         }
     }
     (None, None)
 }
 
-/// Render a person as a hyperlink (or plain text if not found).
-fn person_link(xref: &Option<String>, tree: &FamilyTree) -> String {
-    match xref {
-        Some(x) => {
-            let anchor = xref_to_id(x);
-            let name = tree
-                .individuals
-                .get(x)
-                .map(|i| html_escape(i.display_name()))
-                .unwrap_or_else(|| html_escape(x));
-            format!("<a href=\"#{anchor}\">{name}</a>")
+/// Per-person strings that recur wherever the person is mentioned.
+struct PersonLabel<'a> {
+    /// HTML id of the person's detail card.
+    anchor: Cow<'a, str>,
+    /// HTML-escaped display name.
+    name: Cow<'a, str>,
+    /// Ready-made `<a href="#anchor">name</a>` markup.
+    link: String,
+}
+
+/// Build a map from xref → anchor id, escaped display name and link markup.
+fn person_labels(tree: &FamilyTree) -> HashMap<&str, PersonLabel<'_>> {
+    tree.individuals
+        .iter()
+        .map(|(xref, indi)| {
+            let anchor = xref_to_id(xref);
+            let name = html_escape(indi.display_name());
+            let link = format!("<a href=\"#{anchor}\">{name}</a>");
+            let label = PersonLabel { anchor, name, link };
+            (xref.as_str(), label)
+        })
+        .collect()
+}
+
+/// A person rendered as a hyperlink, labelled with the xref if the person is
+/// not found and empty when there is no xref. Formats straight into the
+/// surrounding `write!`, so no intermediate String is built per link.
+struct PersonLink<'a> {
+    xref: Option<&'a str>,
+    labels: &'a HashMap<&'a str, PersonLabel<'a>>,
+}
+
+impl fmt::Display for PersonLink<'_> {
+    fn fmt(&self, f: &mut fmt::Formatter<'_>) -> fmt::Result {
+        match self.xref {
+            Some(x) => match self.labels.get(x) {
+                Some(label) => f.write_str(&label.link),
+                None => write!(f, "<a href=\"#{}\">{}</a>", xref_to_id(x), html_escape(x)),
+            },
+            None => Ok(()),
         }
-        None => String::new(),
     }
 }
 
+fn person_link<'a>(
+    xref: Option<&'a str>,
+    labels: &'a HashMap<&'a str, PersonLabel<'a>>,
+) -> PersonLink<'a> {
+    PersonLink { xref, labels }
+}
+
 fn push_field(out: &mut String, label: &str, value: &str) {
     if !value.is_empty() {
         let _ = write!(
@@ -336,13 +418,19 @@ fn push_field(out: &mut String, label: &str, value: &str) {
     }
 }
 
-fn push_li(out: &mut String, label: &str, value: &str) {
-    if !value.is_empty() {
-        let _ = writeln!(
-            out,
-            "          <li><span class=\"label\">{label}:</span> {}</li>",
-            html_escape(value)
-        );
+fn push_event_field(out: &mut String, label: &str, event: &Event) {
+    if !event_is_blank(event) {
+        let _ = write!(out, "<dt>{label}</dt><dd>");
+        push_event_text(out, event);
+        out.push_str("</dd>");
+    }
+}
+
+fn push_event_li(out: &mut String, label: &str, event: &Event) {
+    if !event_is_blank(event) {
+        let _ = write!(out, "          <li><span class=\"label\">{label}:</span> ");
+        push_event_text(out, event);
+        out.push_str("</li>\n");
     }
 }
 
@@ -356,6 +444,29 @@ fn resolve_note_text<'a>(note: &'a NoteRef, tree: &'a FamilyTree) -> Option<&'a
     None
 }
 
+// ── Static markup ────────────────────────────────────────────────────────────
+
+const HEAD: &str = r#"<!DOCTYPE html>
+<html lang="en">
+<head>
+  <meta charset="UTF-8">
+  <meta name="viewport" content="width=device-width, initial-scale=1.0">
+  <title>Family Tree</title>
+"#;
+
+const TABLE_HEAD: &str = r#"  <div class="search-bar">
+    <input type="text" id="search" placeholder="Search by name&hellip;" oninput="filterTable(this.value)" aria-label="Search individuals">
+  </div>
+  <section class="table-section">
+    <table id="individuals-table">
+      <thead>
+        <tr>
+          <th>Name</th><th>Sex</th><th>Born</th><th>Died</th><th>Father</th><th>Mother</th>
+        </tr>
+      </thead>
+      <tbody>
+"#;
+
 // ── Embedded CSS ─────────────────────────────────────────────────────────────
 
 const CSS: &str = r#"  <style>
@@ -439,6 +550,8 @@ const CSS: &str = r#"  <style>
       border-radius: var(--radius);
       padding: 20px;
       box-shadow: var(--shadow);
+      content-visibility: auto;
+      contain-intrinsic-size: auto 240px;
     }
     .person-card.male  { border-left: 3px solid #3b82f6; background: var(--male-bg); }
     .person-card.female { border-left: 3px solid #ec4899; background: var(--female-bg); }
@@ -478,13 +591,38 @@ const CSS: &str = r#"  <style>
 // ── Embedded JavaScript ───────────────────────────────────────────────────────
 
 const JS: &str = r#"  <script>
+    var rowIndex = null;
+    var lastQuery = '';
+    var pendingTimer = 0;
+    var pendingFrame = 0;
     function filterTable(query) {
+      clearTimeout(pendingTimer);
+      pendingTimer = setTimeout(function() {
+        if (pendingFrame) cancelAnimationFrame(pendingFrame);
+        pendingFrame = requestAnimationFrame(function() {
+          pendingFrame = 0;
+          applyFilter(query);
+        });
+      }, 100);
+    }
+    function applyFilter(query) {
       var q = query.toLowerCase().trim();
-      var rows = document.querySelectorAll('#individuals-table tbody tr');
-      rows.forEach(function(row) {
-        var name = row.getAttribute('data-name') || '';
-        row.classList.toggle('hidden', q !== '' && !name.includes(q));
-      });
+      if (q === lastQuery) return;
+      lastQuery = q;
+      if (rowIndex === null) {
+        rowIndex = Array.prototype.map.call(
+          document.querySelectorAll('#individuals-table tbody tr'),
+          function(row) { return { row: row, name: row.getAttribute('data-name') || '', hidden: false }; }
+        );
+      }
+      for (var i = 0; i < rowIndex.length; i++) {
+        var entry = rowIndex[i];
+        var hide = q !== '' && entry.name.indexOf(q) === -1;
+        if (hide !== entry.hidden) {
+          entry.hidden = hide;
+          entry.row.classList.toggle('hidden', hide);
+        }
+      }
     }
   </script>
 "#;
@@ -606,6 +744,17 @@ mod tests {
     fn test_html_escapes_special_chars() {
         assert_eq!(html_escape("A & B"), "A &amp; B");
         assert_eq!(html_escape("<tag>"), "&lt;tag&gt;");
+        assert_eq!(html_escape("say \"hi\""), "say &quot;hi&quot;");
+        assert!(matches!(html_escape("John Smith"), Cow::Borrowed(_)));
+    }
+
+    #[test]
+    fn test_html_search_key_is_attribute_escaped() {
+        let mut tree = make_test_tree();
+        tree.individuals.get_mut("@I1@").unwrap().name = Some(Name::from_gedcom("John \"Jack\" /Smith/"));
+
+        let html = render_html(&tree, false);
+        assert!(html.contains("data-name=\"john &quot;jack&quot; smith\""));
     }
 
     #[test]
@@ -638,6 +787,7 @@ mod tests {
     fn test_xref_to_id() {
         assert_eq!(xref_to_id("@I1@"), "I1");
         assert_eq!(xref_to_id("@Homer_Simpson@"), "Homer_Simpson");
+        assert!(matches!(xref_to_id("@I1@"), Cow::Borrowed(_)));
     }
 
     #[test]
@@ -661,6 +811,52 @@ mod tests {
         assert!(html.contains("A notable person."));
     }
 
+    #[test]
+    fn test_html_event_date_and_place() {
+        let mut tree = make_test_tree();
+        tree.individuals.get_mut("@I1@").unwrap().birth.as_mut().unwrap().place =
+            Some(Place::new("Smith & Sons <Farm>"));
+
+        let html = render_html(&tree, false);
+        assert!(html.contains("<dt>Born</dt><dd>1 Jan 1900, Smith &amp; Sons &lt;Farm&gt;</dd>"));
+        assert!(html.contains("<span class=\"label\">Married:</span> 25 Dec 1925</li>"));
+    }
+
+    #[test]
+    fn test_html_omits_empty_vitals() {
+        let tree = make_test_tree();
+        let html = render_html(&tree, false);
+
+        // Jane has no vital events; John's are still listed
+        assert!(!html.contains("<dl class=\"vitals\"></dl>"));
+        assert!(html.contains("<dl class=\"vitals\"><dt>Born</dt>"));
+    }
+
+    #[test]
+    fn test_html_omits_vitals_when_fields_are_blank() {
+        let mut tree = make_test_tree();
+        let jane = tree.individuals.get_mut("@I2@").unwrap();
+        jane.birth = Some(Event { date: None, place: None });
+        jane.occupation = Some(String::new());
+
+        let html = render_html(&tree, false);
+        let start = html.find("id=\"I2\"").unwrap();
+        let end = start + html[start..].find("</article>").unwrap();
+        assert!(!html[start..end].contains("<dl class=\"vitals\">"));
+    }
+
+    #[test]
+    fn test_html_unresolved_note_omits_section() {
+        let mut tree = make_test_tree();
+        tree.individuals.get_mut("@I1@").unwrap().notes.push(NoteRef {
+            text: None,
+            xref: Some("@N404@".to_string()),
+        });
+
+        let html = render_html(&tree, false);
+        assert!(!html.contains("<section class=\"notes\">"));
+    }
+
     #[test]
     fn test_html_embed_svg() {
         let tree = make_test_tree();
@@ -1,3 +1,5 @@
+use std::collections::BTreeSet;
+
 use crate::model::FamilyTree;
 
 /// Supported field aliases for the `list` command.
@@ -33,47 +35,73 @@ impl ListField {
 /// Returns one value per occurrence (not deduplicated).
 pub fn extract(tree: &FamilyTree, field: ListField) -> Vec<String> {
     let mut values = Vec::new();
+    for_each_value(tree, field, true, |v| values.push(v.to_string()));
+    values
+}
 
-    // Sort by xref for deterministic output
+/// Extract distinct field values from a family tree, sorted.
+///
+/// Equivalent to `unique_sorted(extract(tree, field))`, but duplicates are
+/// dropped while collecting so each distinct value is copied only once.
+pub fn extract_unique(tree: &FamilyTree, field: ListField) -> Vec<String> {
+    let mut seen = BTreeSet::new();
+    // Output is sorted by value, so record order does not matter here
+    for_each_value(tree, field, false, |v| {
+        seen.insert(v);
+    });
+    seen.into_iter().map(str::to_string).collect()
+}
+
+/// Visit each occurrence of a field's values, borrowed from the tree.
+/// When `ordered` is set, records are visited in xref order.
+fn for_each_value<'a>(
+    tree: &'a FamilyTree,
+    field: ListField,
+    ordered: bool,
+    mut emit: impl FnMut(&'a str),
+) {
     let mut xrefs: Vec<&String> = tree.individuals.keys().collect();
-    xrefs.sort();
+    if ordered {
+        // Sort by xref for deterministic output
+        xrefs.sort();
+    }
 
     for xref in xrefs {
         let indi = &tree.individuals[xref];
         match field {
             ListField::Names => {
                 if let Some(ref name) = indi.name {
-                    values.push(name.full.clone());
+                    emit(&name.full);
                 }
             }
             ListField::Surnames => {
                 if let Some(ref name) = indi.name {
                     if let Some(ref surname) = name.surname {
-                        values.push(surname.clone());
+                        emit(surname);
                     }
                 }
             }
             ListField::Places => {
                 if let Some(ref birth) = indi.birth {
                     if let Some(ref place) = birth.place {
-                        values.push(place.raw.clone());
+                        emit(&place.raw);
                     }
                 }
                 if let Some(ref death) = indi.death {
                     if let Some(ref place) = death.place {
-                        values.push(place.raw.clone());
+                        emit(&place.raw);
                     }
                 }
             }
             ListField::Dates => {
                 if let Some(ref birth) = indi.birth {
                     if let Some(ref date) = birth.date {
-                        values.push(date.raw.clone());
+                        emit(&date.raw);
                     }
                 }
                 if let Some(ref death) = indi.death {
                     if let Some(ref date) = death.date {
-                        values.push(date.raw.clone());
+                        emit(&date.raw);
                     }
                 }
             }
@@ -82,9 +110,9 @@ pub fn extract(tree: &FamilyTree, field: ListField) -> Vec<String> {
                     let title = tree
                         .sources
                         .get(&citation.source_xref)
-                        .map(|s| s.display_title().to_string())
-                        .unwrap_or_else(|| citation.source_xref.clone());
-                    values.push(title);
+                        .map(|s| s.display_title())
+                        .unwrap_or(&citation.source_xref);
+                    emit(title);
                 }
             }
         }
@@ -93,7 +121,9 @@ pub fn extract(tree: &FamilyTree, field: ListField) -> Vec<String> {
     // Also extract from family events (marriage dates/places)
     if matches!(field, ListField::Places | ListField::Dates) {
         let mut fam_xrefs: Vec<&String> = tree.families.keys().collect();
-        fam_xrefs.sort();
+        if ordered {
+            fam_xrefs.sort();
+        }
 
         for fam_xref in fam_xrefs {
             let fam = &tree.families[fam_xref];
@@ -101,12 +131,12 @@ pub fn extract(tree: &FamilyTree, field: ListField) -> Vec<String> {
                 match field {
                     ListField::Places => {
                         if let Some(ref place) = marriage.place {
-                            values.push(place.raw.clone());
+                            emit(&place.raw);
                         }
                     }
                     ListField::Dates => {
                         if let Some(ref date) = marriage.date {
-                            values.push(date.raw.clone());
+                            emit(&date.raw);
                         }
                     }
                     _ => {}
@@ -114,13 +144,13 @@ pub fn extract(tree: &FamilyTree, field: ListField) -> Vec<String> {
             }
         }
     }
-
-    values
 }
 
 /// Deduplicate and sort values.
 pub fn unique_sorted(mut values: Vec<String>) -> Vec<String> {
-    values.sort();
+    // Equal strings are indistinguishable, so an unstable sort is safe and
+    // avoids the stable sort's scratch allocation
+    values.sort_unstable();
     values.dedup();
     values
 }
@@ -194,6 +224,22 @@ mod tests {
         assert_eq!(surnames, vec!["Doe", "Smith"]);
     }
 
+    #[test]
+    fn test_extract_unique_matches_unique_sorted() {
+        let tree = make_test_tree();
+        for field in [
+            ListField::Surnames,
+            ListField::Places,
+            ListField::Dates,
+            ListField::Sources,
+        ] {
+            assert_eq!(
+                extract_unique(&tree, field),
+                unique_sorted(extract(&tree, field))
+            );
+        }
+    }
+
     #[test]
     fn test_list_places() {
         let tree = make_test_tree();
@@ -39,8 +39,7 @@ fn build_filename_map(tree: &FamilyTree) -> HashMap<String, String> {
 
     for xref in xrefs {
         let indi = &tree.individuals[xref];
-        let base_name = indi.display_name().to_string();
-        let safe_name = sanitize_filename(&base_name);
+        let safe_name = sanitize_filename(indi.display_name());
 
         let count = name_counts.entry(safe_name.clone()).or_insert(0);
         *count += 1;
@@ -252,29 +251,24 @@ fn render_individual(
         out.push('\n');
     }
 
-    // Media references
-    let has_media = indi.media.iter().any(|m| {
-        m.file.is_some()
-            || m.xref
-                .as_ref()
-                .is_some_and(|x| tree.multimedia_objects.contains_key(x))
-    });
-    if has_media {
+    // Media references: resolve each pointer once, keeping entries that
+    // carry a file or point at a known OBJE record
+    let media: Vec<(Option<&str>, Option<&str>)> = indi
+        .media
+        .iter()
+        .filter_map(|m| {
+            let obj = m.xref.as_ref().and_then(|x| tree.multimedia_objects.get(x));
+            if m.file.is_none() && obj.is_none() {
+                return None;
+            }
+            let file = m.file.as_deref().or_else(|| obj.and_then(|o| o.file.as_deref()));
+            let title = obj.and_then(|o| o.title.as_deref());
+            Some((file, title))
+        })
+        .collect();
+    if !media.is_empty() {
         out.push_str("## Media\n\n");
-        for media in &indi.media {
-            let file = media.file.as_deref().or_else(|| {
-                media
-                    .xref
-                    .as_ref()
-                    .and_then(|x| tree.multimedia_objects.get(x))
-                    .and_then(|obj| obj.file.as_deref())
-            });
-            let title = media.xref.as_ref().and_then(|x| {
-                tree.multimedia_objects
-                    .get(x)
-                    .and_then(|obj| obj.title.as_deref())
-            });
-
+        for (file, title) in media {
             match (file, title) {
                 (Some(f), _) if f.starts_with("http://") || f.starts_with("https://") => {
                     let _ = writeln!(out, "- [{}]({})", f, f);
@@ -56,8 +56,8 @@ struct SvgLine {
 }
 
 /// Compute the minimum width needed for the subtree rooted at `xref`.
-fn measure(tree: &FamilyTree, xref: &str, visited: &mut HashSet<String>) -> f32 {
-    if !visited.insert(xref.to_string()) {
+fn measure<'a>(tree: &'a FamilyTree, xref: &'a str, visited: &mut HashSet<&'a str>) -> f32 {
+    if !visited.insert(xref) {
         return BOX_W;
     }
 
@@ -104,14 +104,14 @@ fn measure(tree: &FamilyTree, xref: &str, visited: &mut HashSet<String>) -> f32
 
 /// Place all boxes and lines for the subtree rooted at `xref` starting at (start_x, y).
 /// Returns the total width consumed.
-fn place(
+fn place<'a>(
     boxes: &mut Vec<SvgBox>,
     lines: &mut Vec<SvgLine>,
-    tree: &FamilyTree,
-    xref: &str,
+    tree: &'a FamilyTree,
+    xref: &'a str,
     start_x: f32,
     y: f32,
-    visited: &mut HashSet<String>,
+    visited: &mut HashSet<&'a str>,
 ) -> f32 {
     if visited.contains(xref) {
         return 0.0;
@@ -122,7 +122,7 @@ fn place(
         measure(tree, xref, &mut v)
     };
 
-    visited.insert(xref.to_string());
+    visited.insert(xref);
 
     let indi = match tree.individuals.get(xref) {
         Some(i) => i,
@@ -136,7 +136,7 @@ fn place(
         return total_width;
     }
 
-    let fam_xref = &indi.family_as_spouse[0].clone();
+    let fam_xref = &indi.family_as_spouse[0];
     let fam = match tree.families.get(fam_xref) {
         Some(f) => f,
         None => {
@@ -145,7 +145,7 @@ fn place(
         }
     };
 
-    let spouse_xref = spouse_in_family(tree, xref, fam_xref).map(|s| s.to_string());
+    let spouse_xref = spouse_in_family(tree, xref, fam_xref);
     let has_spouse = spouse_xref.is_some();
     let couple_width = if has_spouse {
         2.0 * BOX_W + H_GAP
@@ -153,11 +153,10 @@ fn place(
         BOX_W
     };
 
-    let unvisited_children: Vec<String> = fam
+    let unvisited_children: Vec<&String> = fam
         .children
         .iter()
         .filter(|c| !visited.contains(c.as_str()))
-        .cloned()
         .collect();
 
     // Compute per-child widths with a shared cumulative visited clone so the
@@ -187,11 +186,10 @@ fn place(
     // Only draw the connector when the spouse is actually placed here; a spouse
     // that was already placed elsewhere in the tree has different coordinates,
     // so drawing a line to the adjacent position would produce a dangling connector.
-    let couple_center_x = if let Some(ref sx) = spouse_xref {
+    let couple_center_x = if let Some(sx) = spouse_xref {
         let spouse_x = couple_x + BOX_W + H_GAP;
-        if !visited.contains(sx) {
+        if visited.insert(sx) {
             boxes.push(make_box(tree, sx, spouse_x, y));
-            visited.insert(sx.to_string());
             // Couple connector (horizontal line between the two boxes)
             lines.push(SvgLine {
                 x1: couple_x + BOX_W,
@@ -298,17 +296,8 @@ fn make_box(tree: &FamilyTree, xref: &str, x: f32, y: f32) -> SvgBox {
         .map(|i| i.display_name().to_string())
         .unwrap_or_else(|| xref.to_string());
 
-    let birth_year = indi
-        .and_then(|i| i.birth.as_ref())
-        .and_then(|e| e.date.as_ref())
-        .and_then(|d| d.year)
-        .map(|y| y.to_string());
-
-    let death_year = indi
-        .and_then(|i| i.death.as_ref())
-        .and_then(|e| e.date.as_ref())
-        .and_then(|d| d.year)
-        .map(|y| y.to_string());
+    let birth_year = indi.and_then(|i| i.birth_year());
+    let death_year = indi.and_then(|i| i.death_year());
 
     let dates = match (birth_year, death_year) {
         (Some(b), Some(d)) => format!("b.{} – d.{}", b, d),
@@ -353,7 +342,7 @@ pub fn render_svg(tree: &FamilyTree) -> String {
     let mut all_lines: Vec<SvgLine> = Vec::new();
 
     let mut offset_y = PADDING;
-    let mut visited: HashSet<String> = HashSet::new();
+    let mut visited: HashSet<&str> = HashSet::new();
 
     for (i, root) in roots.iter().enumerate() {
         if i > 0 {